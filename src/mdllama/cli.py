@@ -1,6 +1,7 @@
 """Main CLI class for mdllama"""
 
 import os
+import re
 import datetime
 from typing import List, Dict, Optional, Any
 from pathlib import Path
@@ -23,6 +24,19 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+# Patterns used to clean up AI-generated search queries, compiled once
+_QUOTE_RE = re.compile(r'^["\']|["\']$')
+_QUERY_LABEL_RE = re.compile(r'(Search query:|Output:)\s*', re.IGNORECASE)
+_THINK_PATTERNS = tuple(re.compile(pattern, re.DOTALL | re.IGNORECASE) for pattern in [
+    r'</think>\s*(.+?)(?:\n|$)',
+    r'</thinking>\s*(.+?)(?:\n|$)',
+    r'<think>.*?</think>\s*(.+?)(?:\n|$)',
+    r'<thinking>.*?</thinking>\s*(.+?)(?:\n|$)'
+])
+_WORD_RE = re.compile(r'\b\w+\b')
+_QUESTION_PREFIX_RE = re.compile(r'^(what|how|why|when|where|who|which)\s+(is|are|do|does|can|could|would|should)\s*')
+_TRAILING_QUESTION_MARKS_RE = re.compile(r'\?+$')
+
 class LLM_CLI:
     """Main CLI class for mdllama."""
     
@@ -41,7 +55,7 @@ class LLM_CLI:
         
         # Initialise web search
         self.search_client = DuckDuckGoSearch(self.output)
-        self.website_fetcher = WebsiteContentFetcher(self.output)
+        self.website_fetcher = WebsiteContentFetcher(self.output, session=self.search_client.session)
         self._pending_search_query = None  # For interactive chat web search enhancement
         
     def setup(self, ollama_host: Optional[str] = None, openai_api_base: Optional[str] = None, provider: str = "ollama"):
@@ -234,22 +248,14 @@ Respond with ONLY the optimized search query, nothing else (not even <think>):""
                                         continue
                                     
                                     # Clean up the response - remove quotes and extra text
-                                    import re
-                                    search_query = re.sub(r'^["\']|["\']$', '', search_query)
-                                    search_query = re.sub(r'(Search query:|Output:)\s*', '', search_query, flags=re.IGNORECASE)
+                                    search_query = _QUOTE_RE.sub('', search_query)
+                                    search_query = _QUERY_LABEL_RE.sub('', search_query)
                                     
                                     # Handle "thinking" model responses - extract actual query from <think> blocks
                                     if '<think>' in search_query or '<thinking>' in search_query:
                                         # Try to extract content after thinking blocks
-                                        think_patterns = [
-                                            r'</think>\s*(.+?)(?:\n|$)',
-                                            r'</thinking>\s*(.+?)(?:\n|$)',
-                                            r'<think>.*?</think>\s*(.+?)(?:\n|$)',
-                                            r'<thinking>.*?</thinking>\s*(.+?)(?:\n|$)'
-                                        ]
-                                        
-                                        for pattern in think_patterns:
-                                            match = re.search(pattern, search_query, re.DOTALL | re.IGNORECASE)
+                                        for pattern in _THINK_PATTERNS:
+                                            match = pattern.search(search_query)
                                             if match:
                                                 extracted = match.group(1).strip()
                                                 if extracted and len(extracted) > 2:
@@ -257,7 +263,7 @@ Respond with ONLY the optimized search query, nothing else (not even <think>):""
                                                     break
                                         else:
                                             # If no extraction worked, fall back to simple keyword extraction
-                                            words = re.findall(r'\b\w+\b', question.lower())
+                                            words = _WORD_RE.findall(question.lower())
                                             filtered_words = [word for word in words if word not in ['what', 'is', 'the', 'how', 'do', 'does'] and len(word) > 2]
                                             search_query = ' '.join(filtered_words[:5]) or question.strip()
                                     
@@ -296,21 +302,13 @@ Respond with ONLY the optimized search query, nothing else (not even <think>):""
                                     continue
                                 
                                 # Clean up the response
-                                import re
-                                search_query = re.sub(r'^["\']|["\']$', '', search_query)
-                                search_query = re.sub(r'(Search query:|Output:)\s*', '', search_query, flags=re.IGNORECASE)
+                                search_query = _QUOTE_RE.sub('', search_query)
+                                search_query = _QUERY_LABEL_RE.sub('', search_query)
                                 
                                 # Handle "thinking" model responses
                                 if '<think>' in search_query or '<thinking>' in search_query:
-                                    think_patterns = [
-                                        r'</think>\s*(.+?)(?:\n|$)',
-                                        r'</thinking>\s*(.+?)(?:\n|$)',
-                                        r'<think>.*?</think>\s*(.+?)(?:\n|$)',
-                                        r'<thinking>.*?</thinking>\s*(.+?)(?:\n|$)'
-                                    ]
-                                    
-                                    for pattern in think_patterns:
-                                        match = re.search(pattern, search_query, re.DOTALL | re.IGNORECASE)
+                                    for pattern in _THINK_PATTERNS:
+                                        match = pattern.search(search_query)
                                         if match:
                                             extracted = match.group(1).strip()
                                             if extracted and len(extracted) > 2:
@@ -318,7 +316,7 @@ Respond with ONLY the optimized search query, nothing else (not even <think>):""
                                                 break
                                     else:
                                         # If no extraction worked, fall back to simple keyword extraction
-                                        words = re.findall(r'\b\w+\b', question.lower())
+                                        words = _WORD_RE.findall(question.lower())
                                         filtered_words = [word for word in words if word not in ['what', 'is', 'the', 'how', 'do', 'does'] and len(word) > 2]
                                         search_query = ' '.join(filtered_words[:5]) or question.strip()
                                 
@@ -338,8 +336,6 @@ Respond with ONLY the optimized search query, nothing else (not even <think>):""
             pass  # Continue to fallback
             
         # Enhanced fallback: Smart keyword extraction with spelling fixes
-        import re
-        
         # Common spelling fixes. removed now since it is now useless
         spelling_fixes = {
             
@@ -357,7 +353,7 @@ Respond with ONLY the optimized search query, nothing else (not even <think>):""
             'will', 'have', 'has', 'had', 'be', 'been', 'being', 'there', 'no'
         ]
         
-        words = re.findall(r'\b\w+\b', question_fixed)
+        words = _WORD_RE.findall(question_fixed)
         filtered_words = [word for word in words if word not in question_words and len(word) > 2]
         
         # Take the most important words
@@ -366,13 +362,13 @@ Respond with ONLY the optimized search query, nothing else (not even <think>):""
         # If still too short, try a different approach
         if len(search_query.split()) < 2:
             # Remove common question patterns but keep the core content
-            cleaned = re.sub(r'^(what|how|why|when|where|who|which)\s+(is|are|do|does|can|could|would|should)\s*', '', question_fixed.strip())
-            cleaned = re.sub(r'\?+$', '', cleaned).strip()
+            cleaned = _QUESTION_PREFIX_RE.sub('', question_fixed.strip())
+            cleaned = _TRAILING_QUESTION_MARKS_RE.sub('', cleaned).strip()
             if cleaned and len(cleaned) > 3:
                 search_query = cleaned
         
         # Final cleanup
-        search_query = re.sub(r'\?+$', '', search_query).strip()
+        search_query = _TRAILING_QUESTION_MARKS_RE.sub('', search_query).strip()
         
         return search_query or question_fixed.strip()
             
@@ -31,6 +31,8 @@ class OllamaClient:
         self.use_colors = use_colors
         self.render_markdown = render_markdown
         self.console = Console() if RICH_AVAILABLE else None
+        # Reuse one connection pool for health checks, listing, pulls and chats
+        self.session = requests.Session()
         
     def setup_client(self) -> bool:
         """Initialize the Ollama client."""
@@ -39,7 +41,7 @@ class OllamaClient:
             
         try:
             # Check if Ollama is running by making a simple request
-            test_response = requests.get(f"{self.host}/api/tags")
+            test_response = self.session.get(f"{self.host}/api/tags")
             if test_response.status_code != 200:
                 return False
                 
@@ -56,7 +58,7 @@ class OllamaClient:
     def list_models(self) -> List[Dict[str, Any]]:
         """List available models from Ollama."""
         try:
-            response = requests.get(f"{self.host}/api/tags")
+            response = self.session.get(f"{self.host}/api/tags")
             if response.status_code == 200:
                 models_data = response.json()
                 return models_data.get('models', [])
@@ -69,7 +71,7 @@ class OllamaClient:
         """Pull a model from Ollama registry with progress display. Handles Ctrl+C gracefully."""
         try:
             url = f"{self.host}/api/pull"
-            resp = requests.post(url, json={"name": model_name}, stream=True)
+            resp = self.session.post(url, json={"name": model_name}, stream=True)
             if resp.status_code != 200:
                 print(f"Error: {resp.status_code} {resp.text}")
                 return False
@@ -129,7 +131,7 @@ class OllamaClient:
         """Delete a model from Ollama."""
         try:
             url = f"{self.host}/api/delete"
-            resp = requests.delete(url, json={"name": model_name})
+            resp = self.session.delete(url, json={"name": model_name})
             if resp.status_code == 200:
                 return True
             else:
@@ -141,7 +143,7 @@ class OllamaClient:
         """List running model processes and return the data."""
         try:
             url = f"{self.host}/api/ps"
-            resp = requests.get(url)
+            resp = self.session.get(url)
             if resp.status_code == 200:
                 data = resp.json()
                 models = data.get('models', [])
@@ -241,7 +243,7 @@ class OllamaClient:
         """List available models with formatted output."""
         try:
             url = f"{self.host}/api/tags"
-            resp = requests.get(url)
+            resp = self.session.get(url)
             if resp.status_code == 200:
                 data = resp.json()
                 
@@ -294,7 +296,7 @@ class OllamaClient:
             
     def _stream_response_generator(self, api_endpoint: str, payload: Dict[str, Any]) -> Generator[Dict[str, Any], None, None]:
         """Generate streaming response chunks."""
-        response = requests.post(api_endpoint, json=payload, stream=True)
+        response = self.session.post(api_endpoint, json=payload, stream=True)
         
         if response.status_code == 200:
             for line in response.iter_lines():
@@ -313,7 +315,7 @@ class OllamaClient:
                                        process_links_callback: Optional[Callable[[str], str]]) -> Optional[str]:
         """Handle streaming response with formatting from original implementation."""
         full_response = ""
-        response = requests.post(api_endpoint, json=payload, stream=True)
+        response = self.session.post(api_endpoint, json=payload, stream=True)
         
         if response.status_code == 200:
             buffer = ""
@@ -394,7 +396,7 @@ class OllamaClient:
                                            current_context: Optional[List[Dict[str, Any]]],
                                            process_links_callback: Optional[Callable[[str], str]]) -> Optional[str]:
         """Handle non-streaming response with formatting from original implementation."""
-        response = requests.post(api_endpoint, json=payload)
+        response = self.session.post(api_endpoint, json=payload)
         
         if response.status_code == 200:
             data = response.json()
@@ -433,7 +435,7 @@ class OllamaClient:
             
     def _stream_response(self, api_endpoint: str, payload: Dict[str, Any]) -> Generator[Dict[str, Any], None, None]:
         """Handle streaming response from Ollama (basic version for compatibility)."""
-        response = requests.post(api_endpoint, json=payload, stream=True)
+        response = self.session.post(api_endpoint, json=payload, stream=True)
         
         if response.status_code == 200:
             for line in response.iter_lines():
@@ -448,7 +450,7 @@ class OllamaClient:
             
     def _non_stream_response(self, api_endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle non-streaming response from Ollama (basic version for compatibility)."""
-        response = requests.post(api_endpoint, json=payload)
+        response = self.session.post(api_endpoint, json=payload)
         
         if response.status_code == 200:
             return response.json()
@@ -11,6 +11,8 @@ class OpenAIClient:
     def __init__(self, api_base: str, config: Dict[str, Any]):
         self.api_base = api_base.rstrip('/')
         self.config = config
+        # Reuse one connection pool (and TLS session) across API calls
+        self.session = requests.Session()
         
     def get_models(self) -> Tuple[List[str], Optional[str]]:
         """Get available models from OpenAI-compatible API."""
@@ -29,7 +31,7 @@ class OpenAIClient:
         
         for endpoint in endpoints_to_try:
             try:
-                resp = requests.get(self.api_base + endpoint, headers=headers)
+                resp = self.session.get(self.api_base + endpoint, headers=headers)
                 if resp.status_code == 200:
                     try:
                         data = resp.json()
@@ -118,7 +120,7 @@ class OpenAIClient:
             
     def _stream_response(self, url: str, payload: Dict[str, Any], headers: Dict[str, str]) -> Generator[Dict[str, Any], None, None]:
         """Handle streaming response from OpenAI-compatible API."""
-        response = requests.post(url, json=payload, headers=headers, stream=True, timeout=30)
+        response = self.session.post(url, json=payload, headers=headers, stream=True, timeout=30)
         
         if response.status_code == 200:
             for line in response.iter_lines():
@@ -138,7 +140,7 @@ class OpenAIClient:
             
     def _non_stream_response(self, url: str, payload: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
         """Handle non-streaming response from OpenAI-compatible API."""
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        response = self.session.post(url, json=payload, headers=headers, timeout=30)
         
         if response.status_code == 200:
             return response.json()
@@ -5,21 +5,256 @@ This module provides web search capabilities
 
 # This is created by GitHub Copilot
 
+import concurrent.futures
+import html as html_module
+import threading
+import time
 import requests
 import json
 import urllib.parse
 import re
-from typing import List, Dict, Optional, Any
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import List, Dict, Optional, Any, Tuple, Iterator
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .output import OutputFormatter
 
+try:
+    import lxml  # noqa: F401  (only probed so BeautifulSoup can use the C parser)
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
 
+# lxml parses several times faster than the pure-Python html.parser
+BS4_PARSER = "lxml" if LXML_AVAILABLE else "html.parser"
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Patterns and word lists are compiled/built once here rather than on every call
+_LINK_RE = re.compile(r'<a[^>]*href="([^"]*)"[^>]*>([^<]+)</a>')
+_TAG_RE = re.compile(r'<[^>]+>')
+_SPACES_RE = re.compile(r'[ \t]+')
+_NON_SPACE_RE = re.compile(r'\S+')
+
+_NAV_WORDS = (
+    'edit', 'view source', 'talk', 'languages', 'toggle', 'menu',
+    'login', 'sign up', 'register', 'subscribe', 'follow us'
+)
+_NAV_WORDS_RE = re.compile('|'.join(re.escape(word) for word in _NAV_WORDS))
+
+# Hosts (and their subdomains) whose links on the results page are DuckDuckGo's own
+_SKIP_DOMAINS = frozenset({'duckduckgo.com', 'ddg.gg'})
+
+# Class selectors for page chrome that is stripped before looking for content
+_NOISE_SELECTOR = ', '.join([
+    '.nav', '.navbar', '.menu', '.sidebar', '.footer', '.header',
+    '.advertisement', '.ads', '.social', '.share', '.comment',
+    '.related-posts', '.breadcrumb', '.pagination', '.toc'
+])
+
+# Common main-content containers, in order of preference
+_CONTENT_SELECTORS = (
+    'article', 'main', '[role="main"]', '.content', '.post-content',
+    '.entry-content', '.article-content', '.story-body', '.post-body',
+    '.content-body', '.article-body', '.text-content'
+)
+_CONTENT_SELECTOR = ', '.join(_CONTENT_SELECTORS)
+
+try:
+    import bs4
+    import soupsieve
+    # Compile the CSS selectors once instead of re-parsing them on every select() call
+    _NOISE_SV = soupsieve.compile(_NOISE_SELECTOR)
+    _CONTENT_SV = soupsieve.compile(_CONTENT_SELECTOR)
+    _CONTENT_SVS = tuple(soupsieve.compile(selector) for selector in _CONTENT_SELECTORS)
+    BS4_AVAILABLE = True
+except ImportError:
+    BS4_AVAILABLE = False
+
+_JUNK_PATTERNS = (
+    'click here', 'read more', 'learn more', 'sign up', 'log in', 'login',
+    'subscribe', 'newsletter', 'follow us', 'share this', 'tweet',
+    'facebook', 'twitter', 'instagram', 'linkedin',
+    'advertisement', 'sponsored', 'cookie', 'privacy policy',
+    'terms of service', 'contact us', 'about us', 'home page',
+    'menu', 'navigation', 'search', 'loading'
+)
+# All junk patterns as one alternation so a line is checked in a single scan
+_JUNK_RE = re.compile('|'.join(re.escape(pattern) for pattern in _JUNK_PATTERNS))
+
+# Upper bounds on how much of a page body is downloaded; the extractors only
+# keep the first few KB of text, so the tail of very large pages is never needed
+_PAGE_TEXT_MAX_BYTES = 512 * 1024
+_WEBSITE_MAX_BYTES = 2 * 1024 * 1024
+
+# Result pages are fetched through the search session, whose default Accept asks for JSON
+_PAGE_REQUEST_HEADERS = {'Accept': 'text/html,application/xhtml+xml;q=0.9,*/*;q=0.1'}
+
+
+def _read_capped_text(response: requests.Response, limit: int) -> str:
+    """Read at most `limit` bytes of a streamed response body and decode it."""
+    chunks = []
+    received = 0
+    try:
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            received += len(chunk)
+            if received >= limit:
+                break
+    finally:
+        response.close()
+    body = b''.join(chunks)[:limit]
+    try:
+        return body.decode(response.encoding or 'utf-8', errors='replace')
+    except (LookupError, TypeError):
+        # Unknown or invalid charset from the server; decode leniently as response.text does
+        return body.decode('utf-8', errors='replace')
+
+
+@lru_cache(maxsize=4096)
+def _is_likely_junk_line(line: str) -> bool:
+    """Check if a line is likely junk (navigation, ads, etc.).
+    
+    Cached because the same boilerplate lines repeat within and across pages.
+    """
+    line_lower = line.lower().strip()
+    
+    # Skip very short lines
+    if len(line_lower) < 3:
+        return True
+    
+    # Skip lines that are mostly repeated characters
+    if len(set(line_lower)) < 3:
+        return True
+    
+    # Skip common navigation/UI text (only short lines are treated as UI labels)
+    if len(line_lower) < 50:
+        return _JUNK_RE.search(line_lower) is not None
+    
+    return False
+
+
+class _TextExtractor(HTMLParser):
+    """Collects the text of an HTML document, skipping script/style/noscript bodies."""
+    
+    _SKIP_TAGS = frozenset({'script', 'style', 'noscript'})
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip_depth = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+    
+    def handle_endtag(self, tag):
+        if tag in self._SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+    
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+@lru_cache(maxsize=None)
+def _shared_http_adapter() -> HTTPAdapter:
+    """Return the keep-alive adapter (and so the connection pools) shared by all web sessions."""
+    return HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        # Only retry gateway errors: retrying connect, read or other errors (such as a
+        # failed TLS handshake) would multiply the caller's timeout for a bad host
+        max_retries=Retry(
+            total=2, connect=0, read=False, other=0, status=2, backoff_factor=0.2,
+            status_forcelist=[502, 503, 504], raise_on_status=False
+        )
+    )
+
+
+def _mount_pooled_adapter(session: requests.Session) -> None:
+    """Mount the shared keep-alive adapter with a larger connection pool and gateway-error retries."""
+    adapter = _shared_http_adapter()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def _is_external_result_url(url: str) -> bool:
+    """Check that a results-page link is an http(s) URL outside DuckDuckGo's own domains."""
+    try:
+        parts = urllib.parse.urlsplit(url)
+        hostname = parts.hostname
+    except ValueError:
+        # Malformed link (e.g. an unclosed IPv6 bracket); skip just this one
+        return False
+    if parts.scheme not in ('http', 'https'):
+        return False
+    
+    # Test the host and each parent domain against the set, e.g. lite.duckduckgo.com
+    labels = (hostname or '').split('.')
+    return not any('.'.join(labels[i:]) in _SKIP_DOMAINS for i in range(len(labels) - 1))
+
+
+def _url_cache_key(url: str) -> str:
+    """Normalise a URL for cache lookups: drop the fragment and any trailing slash."""
+    try:
+        parts = urllib.parse.urlsplit(url)
+    except ValueError:
+        # Malformed URL; key it as-is and let the fetch itself fail
+        return url
+    return urllib.parse.urlunsplit((
+        parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), parts.query, ''
+    ))
+
+
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire after `ttl` seconds."""
+    
+    def __init__(self, maxsize: int = 256, ttl: float = 600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any) -> Any:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: Any, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries if full."""
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+@dataclass
 class WebSearchResult:
     """a single web search result."""
     
-    def __init__(self, title: str, url: str, snippet: str):
-        self.title = title
-        self.url = url
-        self.snippet = snippet
+    # Explicit __slots__ (dataclass(slots=True) needs Python 3.10) drops the per-instance __dict__
+    __slots__ = ('title', 'url', 'snippet')
+    
+    title: str
+    url: str
+    snippet: str
     
     def to_dict(self) -> Dict[str, str]:
         """Convert to dictionary format."""
@@ -42,6 +277,19 @@ class DuckDuckGoSearch:
             'Accept-Language': 'en-US,en;q=0.9',
             'DNT': '1'
         })
+        _mount_pooled_adapter(self.session)
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        # Repeated searches hit the same pages and queries; keep them for 10 minutes
+        self._page_cache = _TTLCache(maxsize=256, ttl=600)
+        self._instant_answer_cache = _TTLCache(maxsize=128, ttl=600)
+    
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Lazily create the worker pool shared by every search for page fetches."""
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=10, thread_name_prefix="mdllama-search"
+            )
+        return self._executor
     
     def search(self, query: str, max_results: int = 5) -> List[WebSearchResult]:
         """
@@ -58,17 +306,32 @@ class DuckDuckGoSearch:
             # Limit max_results to reasonable bounds
             max_results = min(max(1, max_results), 10)
             
-            # Try HTML search first as it's more reliable
-            results = self._search_html(query, max_results)
+            # Query the HTML search and the instant answer API at the same time.
+            # HTML search is preferred as it's more reliable; the instant answer
+            # fallback is then already in hand if it comes back empty
+            executor = self._get_executor()
+            html_future = executor.submit(self._search_html, query, max_results)
+            instant_answer_future = executor.submit(self._search_instant_answer, query, max_results)
+            results = html_future.result() or instant_answer_future.result()
             
-            # If HTML search doesn't work, try the instant answer API
-            if not results:
-                results = self._search_instant_answer(query, max_results)
-            
-            # For each result, fetch and extract readable text from the URL
-            for result in results:
-                if result.url and result.url.startswith("http"):
-                    page_text = self._extract_page_text(result.url)
+            # If neither search found anything, point the user at a manual search
+            if not results and query:
+                results = [WebSearchResult(
+                    title=f"Search results for: {query}",
+                    url="https://duckduckgo.com/?q=" + urllib.parse.quote(query),
+                    snippet=f"No detailed results available. You can search manually for: {query}"
+                )]
+            
+            # For each result, fetch and extract readable text from the URL.
+            # The fetches are I/O bound, so run them concurrently, and fetch each
+            # distinct URL only once even if several results point at it
+            fetchable = [result for result in results if result.url and result.url.startswith("http")]
+            if fetchable:
+                unique_urls = list(dict.fromkeys(result.url for result in fetchable))
+                page_texts = dict(zip(unique_urls, executor.map(self._extract_page_text, unique_urls)))
+                
+                for result in fetchable:
+                    page_text = page_texts[result.url]
                     if page_text:
                         # Only add if not already present and not too long
                         if not result.snippet or len(result.snippet) < 100:
@@ -87,6 +350,12 @@ class DuckDuckGoSearch:
         """
         Search using DuckDuckGo instant answer API.
         """
+        cache_key = (' '.join(query.lower().split()), max_results)
+        cached = self._instant_answer_cache.get(cache_key)
+        if cached is not None:
+            # Results get their snippets rewritten by search(), so hand out fresh copies
+            return [WebSearchResult(**item) for item in cached]
+        
         try:
             # DuckDuckGo Instant Answer API
             instant_url = "https://api.duckduckgo.com/"
@@ -122,6 +391,8 @@ class DuckDuckGoSearch:
                         snippet=topic.get('Text', '')
                     ))
             
+            if results:
+                self._instant_answer_cache.set(cache_key, [result.to_dict() for result in results])
             return results
             
         except Exception as e:
@@ -154,23 +425,11 @@ class DuckDuckGoSearch:
             html_content = response.text
             results = []
             
-            # Look for result blocks in DuckDuckGo lite's simpler HTML structure
-            import re
-            
-            # Pattern to match result links - DuckDuckGo lite has simpler structure
-            # Look for links that are search results (not ads or internal links)
-            link_pattern = r'<a[^>]*href="([^"]*)"[^>]*>([^<]+)</a>'
-            
-            links = re.findall(link_pattern, html_content)
-            
             # Filter out DuckDuckGo internal links and extract actual results
             filtered_results = []
-            for url, title in links:
+            for url, title in self._iter_result_links(html_content):
                 # Skip DuckDuckGo internal links
-                if ('duckduckgo.com' not in url and 
-                    'ddg.gg' not in url and 
-                    url.startswith('http') and
-                    len(title.strip()) > 3):
+                if len(title.strip()) > 3 and _is_external_result_url(url):
                     
                     # Clean up title
                     title = self._clean_html_text(title)
@@ -189,35 +448,34 @@ class DuckDuckGoSearch:
             for url, title, snippet in filtered_results:
                 results.append(WebSearchResult(title, url, snippet))
             
-            # If we still don't have results, create some basic ones from the query
-            if not results and query:
-                # This is a fallback to show that search was attempted
-                results.append(WebSearchResult(
-                    title=f"Search results for: {query}",
-                    url="https://duckduckgo.com/?q=" + urllib.parse.quote(query),
-                    snippet=f"No detailed results available. You can search manually for: {query}"
-                ))
-            
             return results
             
         except Exception as e:
-            # If HTML search fails, return a basic result indicating the search attempt
-            return [WebSearchResult(
-                title=f"Search for: {query}",
-                url="https://duckduckgo.com/?q=" + urllib.parse.quote(query),
-                snippet=f"Web search encountered an issue. You can search manually for: {query}"
-            )]
+            # If HTML search fails, let search() fall back to the instant answer results
+            return []
+    
+    def _iter_result_links(self, html_content: str) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (href, text) for each link in DuckDuckGo lite's results page.
+        
+        Uses selectolax's native parser and CSS engine when available. Otherwise the
+        links are matched lazily with a single regex scan, which stops as soon as the
+        caller has collected enough results instead of matching the whole page.
+        """
+        if SELECTOLAX_AVAILABLE:
+            for node in LexborHTMLParser(html_content).css('a[href]'):
+                yield node.attributes.get('href') or '', node.text()
+        else:
+            for link_match in _LINK_RE.finditer(html_content):
+                yield link_match.group(1), link_match.group(2)
     
     def _clean_html_text(self, text: str) -> str:
         """Clean HTML entities and tags from text."""
-        import html
-        
         # Decode HTML entities
-        text = html.unescape(text)
+        text = html_module.unescape(text)
         
         # Remove any remaining HTML tags (basic cleanup)
-        import re
-        text = re.sub(r'<[^>]*>', '', text)
+        text = _TAG_RE.sub('', text)
         
         # Clean up whitespace
         text = ' '.join(text.split())
@@ -238,17 +496,17 @@ class DuckDuckGoSearch:
         if not results:
             return f"No search results found for: {query}"
         
-        formatted = f"Search results for: {query}\n\n"
+        lines = [f"Search results for: {query}", ""]
         
         for i, result in enumerate(results, 1):
-            formatted += f"{i}. **{result.title}**\n"
+            lines.append(f"{i}. **{result.title}**")
             if result.url:
-                formatted += f"   URL: {result.url}\n"
+                lines.append(f"   URL: {result.url}")
             if result.snippet:
-                formatted += f"   {result.snippet}\n"
-            formatted += "\n"
+                lines.append(f"   {result.snippet}")
+            lines.append("")
         
-        return formatted.strip()
+        return "\n".join(lines).strip()
     
     def search_and_format(self, query: str, max_results: int = 5) -> str:
         """
@@ -265,16 +523,42 @@ class DuckDuckGoSearch:
         return self.format_results(results, query)
     
     def _extract_page_text(self, url: str) -> str:
+        """Return the readable text of a page, served from cache when recently fetched."""
+        cache_key = _url_cache_key(url)
+        cached = self._page_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        page_text = self._fetch_page_text(url)
+        if page_text:
+            self._page_cache.set(cache_key, page_text)
+        return page_text
+    
+    def _fetch_page_text(self, url: str) -> str:
         """
         Fetch the page and extract readable text using BeautifulSoup.
         Returns a summary of the main content, filtering out navigation and boilerplate.
         """
+        if not BS4_AVAILABLE:
+            return ""
+        
         try:
-            import bs4
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            html = response.text
-            soup = bs4.BeautifulSoup(html, "html.parser")
+            response = self.session.get(url, timeout=10, stream=True, headers=_PAGE_REQUEST_HEADERS)
+            try:
+                response.raise_for_status()
+            except requests.HTTPError:
+                # Streamed responses hold their pooled connection until closed
+                response.close()
+                raise
+            
+            # Skip PDFs, images and other non-HTML resources before downloading their bodies
+            content_type = response.headers.get('content-type', '').lower()
+            if content_type and 'html' not in content_type:
+                response.close()
+                return ""
+            
+            html = _read_capped_text(response, _PAGE_TEXT_MAX_BYTES)
+            soup = bs4.BeautifulSoup(html, BS4_PARSER)
             
             # Remove unwanted elements that typically contain noise
             for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 
@@ -282,25 +566,22 @@ class DuckDuckGoSearch:
                                'textarea', 'iframe', 'embed', 'object']):
                 element.decompose()
             
-            # Remove elements with common navigation/menu class names
-            for selector in ['.nav', '.navbar', '.menu', '.sidebar', '.footer', '.header',
-                           '.advertisement', '.ads', '.social', '.share', '.comment',
-                           '.related-posts', '.breadcrumb', '.pagination', '.toc']:
-                for element in soup.select(selector):
-                    element.decompose()
+            # Remove elements with common navigation/menu class names (one tree walk)
+            for element in _NOISE_SV.select(soup):
+                element.decompose()
             
             # Try multiple strategies to find main content
             content_text = ""
             
-            # Strategy 1: Look for common content containers
-            content_selectors = [
-                'article', 'main', '[role="main"]', '.content', '.post-content', 
-                '.entry-content', '.article-content', '.story-body', '.post-body',
-                '.content-body', '.article-body', '.text-content'
-            ]
+            # Strategy 1: Look for common content containers. Collect every candidate
+            # in one tree walk, then take the first match of each selector by preference
+            content_candidates = _CONTENT_SV.select(soup)
             
-            for selector in content_selectors:
-                content_element = soup.select_one(selector)
+            for selector in _CONTENT_SVS:
+                content_element = next(
+                    (candidate for candidate in content_candidates if selector.match(candidate)),
+                    None
+                )
                 if content_element:
                     # Extract text from paragraphs within this content area
                     paragraphs = content_element.find_all('p')
@@ -310,32 +591,31 @@ class DuckDuckGoSearch:
             
             # Strategy 2: If no content container found, get paragraphs but filter better
             if not content_text:
-                all_paragraphs = soup.find_all('p')
-                # Filter out short paragraphs (likely navigation or boilerplate)
-                meaningful_paragraphs = []
-                for p in all_paragraphs:
-                    text = p.get_text(strip=True)
-                    # Only include paragraphs that are substantial and don't look like navigation
-                    if (len(text) > 50 and 
-                        not any(nav_word in text.lower() for nav_word in 
-                               ['edit', 'view source', 'talk', 'languages', 'toggle', 'menu', 
-                                'login', 'sign up', 'register', 'subscribe', 'follow us'])):
-                        meaningful_paragraphs.append(text)
+                # Only include paragraphs that are substantial (short ones are likely
+                # navigation or boilerplate) and don't look like navigation
+                meaningful_paragraphs = [
+                    text for p in soup.find_all('p')
+                    if len(text := p.get_text(strip=True)) > 50
+                    and not _NAV_WORDS_RE.search(text.lower())
+                ]
                 
                 content_text = ' '.join(meaningful_paragraphs)
             
             # Strategy 3: Final fallback - get the largest text block
             if not content_text:
-                # Find the element with the most text content
-                max_text = ""
-                for element in soup.find_all(['div', 'section', 'article']):
-                    element_text = element.get_text(separator=' ', strip=True)
-                    if len(element_text) > len(max_text) and len(element_text) > 100:
-                        max_text = element_text
-                content_text = max_text
-            
-            # Clean up whitespace and return first meaningful portion
-            content_text = ' '.join(content_text.split())
+                content_text = self._largest_text_block(soup)
+            
+            # Clean up whitespace and return first meaningful portion. Words are only
+            # collected until the collapsed text passes the 1000-character cut below,
+            # so the tail of a long page is never split or joined
+            words = []
+            collapsed_length = -1
+            for match in _NON_SPACE_RE.finditer(content_text):
+                words.append(match.group())
+                collapsed_length += len(words[-1]) + 1
+                if collapsed_length > 1000:
+                    break
+            content_text = ' '.join(words)
             
             # Return the first 1000 characters of meaningful content
             if len(content_text) > 1000:
@@ -351,6 +631,45 @@ class DuckDuckGoSearch:
             
         except Exception as e:
             return ""
+    
+    def _largest_text_block(self, soup: Any) -> str:
+        """
+        Return the text of the div/section/article with the most text (over 100 chars).
+        
+        Calling get_text() on every candidate re-walks each nested subtree, which is
+        quadratic on deeply nested pages. Instead, text sizes are summed bottom-up in
+        a single pass and get_text() is only called on the winner. The measured size
+        equals len(get_text(separator=' ', strip=True)): the non-blank stripped
+        strings plus one separator between each pair of them.
+        """
+        text_types = (bs4.NavigableString, bs4.CData)
+        char_counts: Dict[int, int] = {}
+        string_counts: Dict[int, int] = {}
+        
+        # Reversed document order visits every descendant before its ancestors
+        for node in reversed(list(soup.descendants)):
+            if type(node) in text_types:
+                stripped_length = len(node.strip())
+                chars, strings = (stripped_length, 1) if stripped_length else (0, 0)
+            elif isinstance(node, bs4.Tag):
+                chars = char_counts.get(id(node), 0)
+                strings = string_counts.get(id(node), 0)
+            else:
+                continue
+            
+            parent_id = id(node.parent)
+            char_counts[parent_id] = char_counts.get(parent_id, 0) + chars
+            string_counts[parent_id] = string_counts.get(parent_id, 0) + strings
+        
+        best_element = None
+        best_length = 100
+        for element in soup.find_all(['div', 'section', 'article']):
+            strings = string_counts.get(id(element), 0)
+            length = char_counts.get(id(element), 0) + max(strings - 1, 0)
+            if length > best_length:
+                best_element, best_length = element, length
+        
+        return best_element.get_text(separator=' ', strip=True) if best_element else ""
         
 
 def create_search_prompt_enhancement(query: str, search_results: List[WebSearchResult]) -> str:
@@ -369,33 +688,38 @@ def create_search_prompt_enhancement(query: str, search_results: List[WebSearchR
     if not search_results:
         return query
     
-    enhancement = "\n\n--- Web Search Results ---\n"
+    parts = ["\n\n--- Web Search Results ---\n"]
     for i, result in enumerate(search_results, 1):
-        enhancement += f"\n{i}. {result.title}\n"
+        parts.append(f"\n{i}. {result.title}\n")
         if result.snippet:
-            enhancement += f"   {result.snippet}\n"
+            parts.append(f"   {result.snippet}\n")
         if result.url:
-            enhancement += f"   Source: {result.url}\n"
+            parts.append(f"   Source: {result.url}\n")
     
-    enhancement += "\n--- End Search Results ---\n\n"
-    enhancement += "Please use the above web search results to provide a more comprehensive and up-to-date response to the following query:\n\n"
-    enhancement += query
+    parts.append("\n--- End Search Results ---\n\n")
+    parts.append("Please use the above web search results to provide a more comprehensive and up-to-date response to the following query:\n\n")
+    parts.append(query)
     
-    return enhancement
+    return "".join(parts)
 
 
 class WebsiteContentFetcher:
     """Fetches and processes content from websites."""
     
-    def __init__(self, output: Optional[OutputFormatter] = None):
+    def __init__(self, output: Optional[OutputFormatter] = None, session: Optional[requests.Session] = None):
         self.output = output or OutputFormatter(use_colors=True, render_markdown=False)
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Sent with each request rather than set on the session, which may be shared
+        self.headers = {
             'User-Agent': 'mdllama/4.1.2 (Content Fetcher Bot)',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
             'DNT': '1'
-        })
+        }
+        if session is None:
+            session = requests.Session()
+            _mount_pooled_adapter(session)
+        self.session = session
+        self._content_cache = _TTLCache(maxsize=64, ttl=600)
     
     def fetch_website_content(self, url: str, max_length: int = 8000) -> Optional[str]:
         """
@@ -415,23 +739,13 @@ class WebsiteContentFetcher:
             
             self.output.print_info(f"Fetching content from: {url}")
             
-            # Fetch the webpage
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            
-            # Check content type
-            content_type = response.headers.get('content-type', '').lower()
-            if 'text/html' not in content_type:
-                self.output.print_error(f"URL does not return HTML content: {content_type}")
-                return None
-            
-            # Extract text content from HTML
-            html_content = response.text
-            text_content = self._extract_text_from_html(html_content)
-            
-            if not text_content.strip():
-                self.output.print_error("No readable text content found on the page")
-                return None
+            cache_key = _url_cache_key(url)
+            text_content = self._content_cache.get(cache_key)
+            if text_content is None:
+                text_content = self._download_text(url)
+                if text_content is None:
+                    return None
+                self._content_cache.set(cache_key, text_content)
             
             # Truncate if too long
             if len(text_content) > max_length:
@@ -447,6 +761,34 @@ class WebsiteContentFetcher:
             self.output.print_error(f"Unexpected error: {e}")
             return None
     
+    def _download_text(self, url: str) -> Optional[str]:
+        """Download a page and extract its text, or return None if it has none."""
+        # Fetch the webpage
+        response = self.session.get(url, timeout=15, stream=True, headers=self.headers)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            # Streamed responses hold their pooled connection until closed
+            response.close()
+            raise
+        
+        # Check content type (headers arrive before the body is downloaded)
+        content_type = response.headers.get('content-type', '').lower()
+        if 'text/html' not in content_type:
+            response.close()
+            self.output.print_error(f"URL does not return HTML content: {content_type}")
+            return None
+        
+        # Extract text content from HTML
+        html_content = _read_capped_text(response, _WEBSITE_MAX_BYTES)
+        text_content = self._extract_text_from_html(html_content)
+        
+        if not text_content.strip():
+            self.output.print_error("No readable text content found on the page")
+            return None
+        
+        return text_content
+    
     def _extract_text_from_html(self, html: str) -> str:
         """
         Extract readable text content from HTML.
@@ -455,66 +797,32 @@ class WebsiteContentFetcher:
         For better extraction, consider using libraries like BeautifulSoup or readability-lxml.
         """
         try:
-            # Remove script and style tags and their content
-            html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-            html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
-            
-            # Remove HTML comments
-            html = re.sub(r'<!--.*?-->', '', html, flags=re.DOTALL)
-            
-            # Remove all HTML tags
-            text = re.sub(r'<[^>]+>', '', html)
-            
-            # Decode HTML entities
-            import html as html_module
-            text = html_module.unescape(text)
-            
-            # Clean up whitespace
-            text = re.sub(r'\n\s*\n', '\n\n', text)  # Multiple newlines to double newlines
-            text = re.sub(r'[ \t]+', ' ', text)      # Multiple spaces to single space
-            text = text.strip()
-            
-            # Remove excessively long lines of repeated characters (likely formatting artifacts)
-            lines = text.split('\n')
-            cleaned_lines = []
-            for line in lines:
-                line = line.strip()
-                if line and not self._is_likely_junk_line(line):
-                    cleaned_lines.append(line)
-            
-            return '\n'.join(cleaned_lines)
+            if SELECTOLAX_AVAILABLE:
+                # One native parse: drops script/style bodies, comments and tags, decodes entities
+                tree = LexborHTMLParser(html)
+                tree.strip_tags(['script', 'style', 'noscript'])
+                root = tree.root
+                text = root.text(separator='') if root is not None else ''
+            else:
+                # Single streaming pass with the stdlib tokenizer: skips script/style
+                # bodies and comments, drops tags and decodes entities as it goes
+                extractor = _TextExtractor()
+                extractor.feed(html)
+                extractor.close()
+                text = ''.join(extractor.parts)
+            
+            # Collapse runs of spaces; blank lines are dropped by the line filter below
+            text = _SPACES_RE.sub(' ', text)
+            
+            # Drop blank lines and likely junk (navigation, ads, repeated-character rules)
+            return '\n'.join(
+                line for line in map(str.strip, text.split('\n'))
+                if line and not _is_likely_junk_line(line)
+            )
             
         except Exception as e:
             self.output.print_error(f"Error extracting text from HTML: {e}")
             return ""
-    
-    def _is_likely_junk_line(self, line: str) -> bool:
-        """Check if a line is likely junk (navigation, ads, etc.)."""
-        line_lower = line.lower().strip()
-        
-        # Skip very short lines
-        if len(line_lower) < 3:
-            return True
-        
-        # Skip lines that are mostly repeated characters
-        if len(set(line_lower)) < 3:
-            return True
-        
-        # Skip common navigation/UI text
-        junk_patterns = [
-            'click here', 'read more', 'learn more', 'sign up', 'log in', 'login',
-            'subscribe', 'newsletter', 'follow us', 'share this', 'tweet',
-            'facebook', 'twitter', 'instagram', 'linkedin',
-            'advertisement', 'sponsored', 'cookie', 'privacy policy',
-            'terms of service', 'contact us', 'about us', 'home page',
-            'menu', 'navigation', 'search', 'loading'
-        ]
-        
-        for pattern in junk_patterns:
-            if pattern in line_lower and len(line_lower) < 50:
-                return True
-        
-        return False
 
 
 def create_website_prompt_enhancement(query: str, website_content: str, url: str) -> str:
@@ -532,10 +840,10 @@ def create_website_prompt_enhancement(query: str, website_content: str, url: str
     if not website_content:
         return query
     
-    enhancement = f"\n\n--- Website Content from {url} ---\n"
-    enhancement += website_content
-    enhancement += f"\n--- End Website Content ---\n\n"
-    enhancement += "Please use the above website content to provide a comprehensive response to the following query:\n\n"
-    enhancement += query
-    
-    return enhancement
+    return "".join([
+        f"\n\n--- Website Content from {url} ---\n",
+        website_content,
+        "\n--- End Website Content ---\n\n",
+        "Please use the above website content to provide a comprehensive response to the following query:\n\n",
+        query
+    ])
@@ -12,7 +12,7 @@ setup(
         "colorama",
         "ollama"
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.8",
     entry_points={
         "console_scripts": [
             "mdllama=mdllama.main:main"